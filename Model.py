@@ -1,4 +1,5 @@
 import time
+import asyncio
 import numpy as np
 import logging
 
@@ -27,7 +28,15 @@ class Model(QObject):
         self.breath_analyser = BreathAnalyser()
 
         # Buffer for raw ECG samples (if available)
-        self.ecg_history = HistoryBuffer(buffer_size=10000)
+        self.ecg_history = HistoryBuffer(buffer_size=10000, dtype=np.int16)
+        # Assume a fixed ECG sampling rate (e.g., 250 Hz)
+        self.ECG_SAMPLE_RATE = 250.0
+        # Sample time offsets within a packet, and scratch space for packet timestamps
+        self.ecg_sample_offsets = np.arange(4096, dtype=np.float64) / self.ECG_SAMPLE_RATE
+        self.ecg_timestamps = np.empty(4096, dtype=np.float64)
+        # Received ECG packets, decoded by process_ecg_queue off the BLE callback
+        self.ecg_queue = asyncio.Queue(maxsize=64)
+        self.ecg_task = None
 
     async def set_and_connect_sensor(self, sensor: BlehrmClientInterface):
         """
@@ -45,6 +54,9 @@ class Model(QObject):
         # Try to start raw ECG stream if supported
         try:
             await self.sensor_client.start_ecg_stream(callback=self.handle_ecg_callback)
+            # Keep a single consumer if connecting again without a disconnect
+            if self.ecg_task is None or self.ecg_task.done():
+                self.ecg_task = asyncio.create_task(self.process_ecg_queue())
         except Exception:
             self.logger.warning("ECG stream not available on this device")
 
@@ -55,6 +67,12 @@ class Model(QObject):
         """
         Disconnect from the sensor.
         """
+        if self.ecg_task:
+            self.ecg_task.cancel()
+            self.ecg_task = None
+        # Don't carry stale packets over to the next connection
+        while not self.ecg_queue.empty():
+            self.ecg_queue.get_nowait()
         if self.sensor_client:
             await self.sensor_client.disconnect()
 
@@ -81,14 +99,45 @@ class Model(QObject):
     def handle_ecg_callback(self, data: bytes):
         """
         Callback for raw ECG bytes (int16 samples).
-        Decodes and buffers them.
+        Queues the packet with its arrival time; decoding happens in process_ecg_queue.
+        """
+        try:
+            self.ecg_queue.put_nowait((time.time(), data))
+        except asyncio.QueueFull:
+            self.logger.warning("ECG queue full, dropping packet")
+
+    async def process_ecg_queue(self):
+        """
+        Decodes queued ECG packets, draining any backlog into a single buffer update.
+        """
+        while True:
+            packets = [await self.ecg_queue.get()]
+            while not self.ecg_queue.empty():
+                packets.append(self.ecg_queue.get_nowait())
+            # A malformed packet only costs its batch, not the rest of the session
+            try:
+                self.buffer_ecg_packets(packets)
+            except Exception:
+                self.logger.exception("Failed to decode ECG packets, dropping batch")
+
+    def buffer_ecg_packets(self, packets):
+        """
+        Decodes (arrival time, bytes) ECG packets and buffers the raw int16 samples.
         """
         # Interpret as little-endian 16-bit integers
-        samples = np.frombuffer(data, dtype=np.int16)
-        # Timestamp of first sample
-        t0 = time.time()
-        # Assume a fixed ECG sampling rate (e.g., 250 Hz)
-        dt = 1.0 / 250.0
-        for i, val in enumerate(samples):
-            timestamp = t0 + i * dt
-            self.ecg_history.update(timestamp, float(val))
+        samples = [np.frombuffer(data, dtype=np.int16) for _, data in packets]
+        max_packet_size = max(packet_samples.size for packet_samples in samples)
+        if max_packet_size > self.ecg_sample_offsets.size:
+            self.ecg_sample_offsets = np.arange(max_packet_size, dtype=np.float64) / self.ECG_SAMPLE_RATE
+        n = sum(packet_samples.size for packet_samples in samples)
+        if n > self.ecg_timestamps.size:
+            self.ecg_timestamps = np.empty(n, dtype=np.float64)
+
+        # Each packet is timestamped from its arrival time at the fixed sample rate
+        timestamps = self.ecg_timestamps[:n]
+        start = 0
+        for (t0, _), packet_samples in zip(packets, samples):
+            end = start + packet_samples.size
+            np.add(self.ecg_sample_offsets[:packet_samples.size], t0, out=timestamps[start:end])
+            start = end
+        self.ecg_history.update_batch(timestamps, np.concatenate(samples))
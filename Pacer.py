@@ -7,12 +7,13 @@ class Pacer(QObject):
     def __init__(self):
         super().__init__()
 
-        theta = np.linspace(0, 2 * np.pi, 40)
-        self.cos_theta = np.cos(theta)
-        self.sin_theta = np.sin(theta)
         self.last_breathing_rate = 1
         self.phase = 0
 
+        # Radius over one breathing cycle indexed by phase, avoiding trig calls on every tick
+        self.PHASE_STEPS = 1024
+        self.radius_table = 0.5 + 0.5 * np.sin(2 * np.pi * np.arange(self.PHASE_STEPS) / self.PHASE_STEPS)
+
     def breathing_pattern(self, breathing_rate, time):
         """Returns radius of pacer disk.
 
@@ -23,17 +24,18 @@ class Pacer(QObject):
             self.phase = time - self.last_breathing_rate*(time - self.phase)/breathing_rate
             self.last_breathing_rate = breathing_rate
 
-        radius = 0.5 + 0.5 * np.sin(2 * np.pi * breathing_rate / 60 * (time - self.phase))
+        cycles = breathing_rate / 60 * (time - self.phase)
+        radius = self.radius_table[int(cycles % 1.0 * self.PHASE_STEPS)]
         return radius
 
-    def update(self, breathing_rate):
-        """Update radius of pacer disc.
+    def update(self, breathing_rate, t=None):
+        """Update radius of pacer disc and return it.
 
         Make current disk radius a function of real time (i.e., don't
         precompute radii with fixed time interval) in order to compensate for
-        jitter or delay in QTimer calls.
+        jitter or delay in QTimer calls. Callers that already read the clock
+        for this tick can pass it as t (seconds, any fixed epoch).
         """
-        radius = self.breathing_pattern(breathing_rate, time.time())
-        x = radius * self.cos_theta
-        y = radius * self.sin_theta
-        return (x, y)
+        if t is None:
+            t = time.time()
+        return self.breathing_pattern(breathing_rate, t)
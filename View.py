@@ -4,16 +4,15 @@ import asyncio
 import logging
 
 import numpy as np
-import neurokit2 as nk  # only needed if you have a raw ECG waveform
 
-from PySide6.QtCore import QTimer, Qt, QPointF, Slot, QSize, QMargins, QPropertyAnimation, QEasingCurve, Property
+from PySide6.QtCore import QTimer, Qt, Slot, QSize, QMargins
 from PySide6.QtWidgets import (
     QVBoxLayout, QHBoxLayout, QSlider, QLabel,
     QWidget, QComboBox, QPushButton, QGraphicsDropShadowEffect,
     QMainWindow, QGridLayout
 )
 from PySide6.QtCharts import QChartView, QLineSeries, QScatterSeries, QAreaSeries
-from PySide6.QtGui import QPen, QPainter, QColor, QFont, QBrush, QIcon, QPainterPath, QMovie
+from PySide6.QtGui import QPainter, QColor, QBrush, QIcon, QPainterPath, QPixmap, QImageReader
 
 from Model import Model
 from sensor import SensorHandler
@@ -21,37 +20,78 @@ from views.widgets import CirclesWidget, SquareWidget
 from views.charts import (
     create_chart, create_scatter_series,
     create_line_series, create_spline_series,
-    create_axis
+    create_axis, create_time_axis, replace_series,
+    downsample
+)
+from styles.colours import (
+    RED, YELLOW, GREEN, BLUE, GRAY, GOLD, PURPLE, DARK_BG, CHART_BG, TEXT_COLOR, LINEWIDTH, DOTSIZE_SMALL,
+    NO_PEN, TITLE_FONT, LABEL_FONT, CONTROL_FONT, VALUE_FONT, RATE_FONT, ACTION_BUTTON_QSS
 )
-from styles.colours import RED, YELLOW, GREEN, BLUE, GRAY, GOLD, PURPLE, DARK_BG, CHART_BG, TEXT_COLOR, LINEWIDTH, DOTSIZE_SMALL
 from styles.utils import get_stylesheet
 
 # Add a HeartWidget for pulsing heart animation
 class HeartWidget(QWidget):
-    """A widget that displays a pulsing heart animation using a GIF."""
-    
+    """A widget that displays a pulsing heart animation by flipping between pre-scaled heart pixmaps."""
+
+    MAX_SCALE = 1.15  # Scale at the peak of a pulse
+    PULSE_PERIOD = 1000  # ms
+    FRAME_PERIOD = 30  # ms, about the frame rate of the original GIF
+    SCALE_STEPS = 8  # Distinct heart sizes rendered per pulse
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setFixedSize(150, 150)
-        
-        # Load the GIF animation from file
-        self.movie = QMovie("img/heartbeat-animation.gif")
-        self.movie.setScaledSize(QSize(150, 150))  # Scale to widget size
-        
-        # Start the animation
-        self.movie.start()
-        
-        # Connect frameChanged signal to update the widget
-        self.movie.frameChanged.connect(self.update)
-    
+
+        # The last frame of the GIF shows the heart with its full ECG trace. Reading the GIF in order
+        # composites each frame over the previous ones, so read through to it
+        reader = QImageReader("img/heartbeat-animation.gif")
+        image = reader.read()
+        while reader.canRead():
+            image = reader.read()
+        heart = QPixmap.fromImage(image)
+
+        # Render each heart size once, so that painting a frame is a plain blit
+        self.hearts = []
+        for k in range(self.SCALE_STEPS):
+            scale = 1 + (self.MAX_SCALE - 1) * k / (self.SCALE_STEPS - 1)
+            size = int(150 * scale / self.MAX_SCALE)
+            self.hearts.append(heart.scaled(size, size, Qt.KeepAspectRatio, Qt.SmoothTransformation))
+
+        # Size step shown at each frame of a pulse, easing in and out like a sine
+        n_frames = self.PULSE_PERIOD // self.FRAME_PERIOD
+        pulse = (1 - np.cos(2 * np.pi * np.arange(n_frames) / n_frames)) / 2
+        self.frames = np.rint(pulse * (self.SCALE_STEPS - 1)).astype(int).tolist()
+        self.frame = 0
+        self.heart = self.hearts[0]
+
+        self.timer = QTimer(self)
+        self.timer.setInterval(self.FRAME_PERIOD)
+        self.timer.timeout.connect(self.next_frame)
+
+    def next_frame(self):
+        self.frame = (self.frame + 1) % len(self.frames)
+        heart = self.hearts[self.frames[self.frame]]
+        # Consecutive frames often share a size; only repaint when it changes
+        if heart is not self.heart:
+            self.heart = heart
+            self.update()
+
+    def showEvent(self, event):
+        # Only animate while shown
+        self.timer.start()
+        super().showEvent(event)
+
+    def hideEvent(self, event):
+        self.timer.stop()
+        super().hideEvent(event)
+
     def paintEvent(self, event):
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
-        
-        # Draw the current frame of the GIF
-        current_frame = self.movie.currentPixmap()
-        painter.drawPixmap(self.rect(), current_frame)
-        
+
+        # Draw the current heart centred in the widget
+        painter.drawPixmap((self.width() - self.heart.width()) // 2,
+                           (self.height() - self.heart.height()) // 2, self.heart)
+
         painter.end()
 
 class View(QMainWindow):
@@ -64,6 +104,9 @@ class View(QMainWindow):
         self.model.sensor_connected.connect(self._on_sensor_connected)
         self.sensor_handler = SensorHandler()
         self.sensor_handler.scan_complete.connect(self._on_scan_complete)
+        # Running BLE tasks; the event loop only keeps weak references to tasks
+        self.scan_task = None
+        self.connect_task = None
 
         # Apply dark mode
         self.setStyleSheet(get_stylesheet("styles/style.qss"))
@@ -93,7 +136,10 @@ class View(QMainWindow):
         # Track window state
         self.compact_mode = False
         
-        # Register window resizing handler
+        # Register window resizing handler, applying compact mode once resizing settles
+        self.resize_timer = QTimer(self)
+        self.resize_timer.setSingleShot(True)
+        self.resize_timer.timeout.connect(self._apply_compact_mode)
         self.resizeEvent = self.handleResize
 
         # build and arrange charts
@@ -105,9 +151,16 @@ class View(QMainWindow):
         self.start_view_update()
 
         # pacer buffers
-        self.pacer_values_hist = np.full((self.PACER_HIST_SIZE, 1), np.nan)
-        self.pacer_times_hist = np.full((self.PACER_HIST_SIZE, 1), np.nan)
-        self.pacer_times_hist_rel_s = np.full(self.PACER_HIST_SIZE, np.nan)
+        self.pacer_values_hist = np.full(self.PACER_HIST_SIZE, np.nan, dtype=np.float32)
+        self.pacer_times_hist = np.zeros(self.PACER_HIST_SIZE, dtype=np.int64) # Monotonic ns since pacer_t0_ns
+        self.pacer_times_hist_rel_s = np.full(self.PACER_HIST_SIZE, np.nan, dtype=np.float32)
+        self.pacer_values_unrolled = np.full(self.PACER_HIST_SIZE, np.nan, dtype=np.float32)
+        self.pacer_t0_ns = time.monotonic_ns()
+        self._pacer_idx = 0 # Next write position in the pacer ring buffers
+        self._pacer_count = 0 # Number of valid samples in the pacer ring buffers
+
+        # History version and time of the last redraw, per series group
+        self.last_drawn = {}
 
     def create_breath_chart(self):
         """Breathing acceleration + HR chart."""
@@ -117,11 +170,7 @@ class View(QMainWindow):
         self.series_breath_cycle = create_scatter_series(GRAY, DOTSIZE_SMALL)
         self.series_hr = create_scatter_series(RED, DOTSIZE_SMALL)
 
-        self.axis_breath_x = create_axis(
-            None, tickCount=10,
-            rangeMin=-self.BREATH_ACC_TIME_RANGE, rangeMax=0,
-            labelSize=16, flip=False
-        )
+        self.axis_breath_x = create_time_axis(self.BREATH_ACC_TIME_RANGE)
         self.axis_breath_y = create_axis(
             "Chest acc (m/s²)", BLUE,
             rangeMin=-1, rangeMax=1, labelSize=16
@@ -131,6 +180,10 @@ class View(QMainWindow):
             rangeMin=40, rangeMax=200, labelSize=16
         )
 
+        # Draw the fast-updating series with OpenGL; these views then skip antialiasing
+        for s in (self.series_pacer, self.series_breath_acc, self.series_hr):
+            s.setUseOpenGL(True)
+
         for s in (self.series_pacer, self.series_breath_acc,
                   self.series_breath_cycle, self.series_hr):
             self.chart_breath.addSeries(s)
@@ -162,27 +215,24 @@ class View(QMainWindow):
         # RMSSD / max-min
         self.series_maxmin = create_spline_series(RED, LINEWIDTH)
         self.series_maxmin_marker = create_scatter_series(RED, DOTSIZE_SMALL)
-        self.axis_hrv_x = create_axis(
-            None, tickCount=10,
-            rangeMin=-self.HRV_SERIES_TIME_RANGE, rangeMax=0, labelSize=16
-        )
+        self.axis_hrv_x = create_time_axis(self.HRV_SERIES_TIME_RANGE)
         self.axis_hrv_y = create_axis(
             "HRV (ms)", RED, rangeMin=0, rangeMax=250, labelSize=16
         )
 
         # HRV bands (store to avoid GC)
         self.hrv_bands = []
+        band_xs = np.array([-self.HRV_SERIES_TIME_RANGE, 0.0])
         for low, high, col in ((0,50,RED),(50,150,YELLOW),(150,2000,GREEN)):
+            # Fixed geometry over the whole time range, set in one bulk replace per boundary
             low_line = QLineSeries()
-            low_line.append(-self.HRV_SERIES_TIME_RANGE, low)
-            low_line.append(0, low)
+            replace_series(low_line, band_xs, np.full(2, low))
             high_line = QLineSeries()
-            high_line.append(-self.HRV_SERIES_TIME_RANGE, high)
-            high_line.append(0, high)
+            replace_series(high_line, band_xs, np.full(2, high))
             band = QAreaSeries(low_line, high_line)
             band.setColor(col)
             band.setOpacity(0.2)
-            band.setPen(QPen(Qt.NoPen))
+            band.setPen(NO_PEN)
             self.hrv_bands.append((low_line, high_line, band))
             self.chart_hrv.addSeries(band)
 
@@ -206,18 +256,16 @@ class View(QMainWindow):
         self.chart_bpm = create_chart(title="Heart Rate", showTitle=True)
         
         # Set the title font to be larger
-        title_font = QFont("Arial", 21, QFont.Bold)  # Increased title font size
-        self.chart_bpm.setTitleFont(title_font)
+        self.chart_bpm.setTitleFont(TITLE_FONT)
         
         self.series_bpm = create_line_series(PURPLE, LINEWIDTH)
-        self.axis_bpm_x = create_axis(
-            None, tickCount=10,
-            rangeMin=-self.HRV_SERIES_TIME_RANGE, rangeMax=0, labelSize=16
-        )
+        # The live BPM chart only needs its horizontal grid lines
+        self.axis_bpm_x = create_time_axis(self.HRV_SERIES_TIME_RANGE, gridLines=False)
         self.axis_bpm_y = create_axis(
             "BPM", PURPLE, rangeMin=40, rangeMax=200, labelSize=16
         )
 
+        self.series_bpm.setUseOpenGL(True)
         self.chart_bpm.addSeries(self.series_bpm)
         self.chart_bpm.addAxis(self.axis_bpm_x, Qt.AlignBottom)
         self.chart_bpm.addAxis(self.axis_bpm_y, Qt.AlignLeft)
@@ -225,7 +273,6 @@ class View(QMainWindow):
         self.series_bpm.attachAxis(self.axis_bpm_y)
 
         self.bpm_view = QChartView(self.chart_bpm)
-        self.bpm_view.setRenderHint(QPainter.Antialiasing)
         self.bpm_view.setStyleSheet("background-color: transparent;")
 
         # Create container for BPM text display and heart animation
@@ -236,7 +283,8 @@ class View(QMainWindow):
         
         # Large BPM text display
         self.bpm_text = QLabel("-- BPM")
-        self.bpm_text.setFont(QFont("Arial", 28, QFont.Bold))  # Increased from 28 to 34
+        self.bpm_value = None # Value shown in bpm_text
+        self.bpm_text.setFont(VALUE_FONT)
         self.bpm_text.setStyleSheet(f"color: {PURPLE.name()};")
         self.bpm_text.setAlignment(Qt.AlignLeft | Qt.AlignVCenter)
         
@@ -259,12 +307,14 @@ class View(QMainWindow):
         bpm_container_layout.addWidget(self.bpm_view)
 
     def update_bpm_series(self):
-        pts = self.model.hrv_analyser.hr_history.get_qpoint_list()
-        self.series_bpm.replace(pts)
-        if pts:
-            val = int(pts[-1].y())
-            # Update the BPM text at the top of the chart
-            self.bpm_text.setText(f"{val} BPM")
+        hr_xy = self.model.hrv_analyser.hr_history.get_xy_array()
+        replace_series(self.series_bpm, *hr_xy.T)
+        if hr_xy.size:
+            val = int(hr_xy[-1, 1])
+            # Update the BPM text at the top of the chart, if the displayed value changed
+            if val != self.bpm_value:
+                self.bpm_value = val
+                self.bpm_text.setText(f"{val} BPM")
 
     def create_circles_layout(self):
         """Creates the breathing visualization and controls layout."""
@@ -282,15 +332,13 @@ class View(QMainWindow):
 
         # Create breathing circles widget with modern styling
         self.circles = CirclesWidget(
-            x_values=self.model.pacer.cos_theta, 
-            y_values=self.model.pacer.sin_theta,
             pacer_color=PURPLE,       # Use purple for pacer
             breathing_color=BLUE,     # Use blue for breathing
             hr_color=RED,             # Use red for heart rate
-            background_image="img/lungs.png"  # Add the lungs background image
+            background_image="img/lungs.png",  # Add the lungs background image
+            shadow=True               # Baked drop shadow, free per frame
         )
         self.circles.setMinimumSize(200, 200)
-        self.circles.setRenderHint(QPainter.Antialiasing)
         
         # Create a widget to hold the breathing visualization
         self.breathingVisualContainer = QWidget()
@@ -314,42 +362,27 @@ class View(QMainWindow):
         
         # Modern styled rate label
         self.rate_label = QLabel(f"Breathing rate: {self.pacer_rate} bpm")
-        self.rate_label.setFont(QFont("Arial", 21))  # Increased from 12 to 16
+        self.rate_label.setFont(RATE_FONT)
         self.rate_label.setAlignment(Qt.AlignCenter)
         
         # Add sensor controls section title
         sensorGroupLabel = QLabel("Sensor Connection")
-        sensorGroupLabel.setFont(QFont("Arial", 21, QFont.Bold))
+        sensorGroupLabel.setFont(TITLE_FONT)
         sensorGroupLabel.setAlignment(Qt.AlignCenter)
         
         # Create enhanced buttons with icons
         self.scan_button = QPushButton("  Scan for Devices")
-        self.scan_button.setFont(QFont("Arial", 11))
+        self.scan_button.setFont(CONTROL_FONT)
         self.scan_button.setIcon(QIcon("img/scan.png"))
         self.scan_button.setIconSize(QSize(24, 24))
         self.scan_button.setMinimumHeight(40)
         self.scan_button.setObjectName("actionButton")
-        self.scan_button.setStyleSheet("""
-            QPushButton#actionButton {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #D23888, stop:1 #e76c9e);
-                border-radius: 8px;
-                padding: 8px 16px;
-                color: white;
-                text-align: left;
-                border: none;
-            }
-            QPushButton#actionButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #e358a2, stop:1 #f086b5);
-            }
-            QPushButton#actionButton:pressed {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #b22a74, stop:1 #c75689);
-            }
-        """)
+        self.scan_button.setStyleSheet(ACTION_BUTTON_QSS)
         self.scan_button.clicked.connect(self._on_scan_button_press)
         
         # Create device selection dropdown
         self.sensor_combo = QComboBox()
-        self.sensor_combo.setFont(QFont("Arial", 11))
+        self.sensor_combo.setFont(CONTROL_FONT)
         self.sensor_combo.setMinimumHeight(40)
         self.sensor_combo.setStyleSheet("""
             QComboBox {
@@ -370,31 +403,12 @@ class View(QMainWindow):
         
         # Connect button styling
         self.connect_button = QPushButton("  Connect")
-        self.connect_button.setFont(QFont("Arial", 11))
+        self.connect_button.setFont(CONTROL_FONT)
         self.connect_button.setIcon(QIcon("img/connect.png"))
         self.connect_button.setIconSize(QSize(24, 24))
         self.connect_button.setMinimumHeight(40) 
         self.connect_button.setObjectName("actionButton")
-        self.connect_button.setStyleSheet("""
-            QPushButton#actionButton {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #D23888, stop:1 #e76c9e);
-                border-radius: 8px;
-                padding: 8px 16px;
-                color: white;
-                text-align: left;
-                border: none;
-            }
-            QPushButton#actionButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #e358a2, stop:1 #f086b5);
-            }
-            QPushButton#actionButton:pressed {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #b22a74, stop:1 #c75689);
-            }
-            QPushButton#actionButton:disabled {
-                background: #444444;
-                color: #888888;
-            }
-        """)
+        self.connect_button.setStyleSheet(ACTION_BUTTON_QSS)
         self.connect_button.clicked.connect(self._on_connect_button_press)
         self.connect_button.setEnabled(False)
         
@@ -405,7 +419,7 @@ class View(QMainWindow):
         
         # Add title label for the control panel
         title_label = QLabel("Breathing Control")
-        title_label.setFont(QFont("Arial", 21, QFont.Bold))  # Increased from 14 to 18
+        title_label.setFont(TITLE_FONT)
         title_label.setAlignment(Qt.AlignCenter)
         controlLayout.addWidget(title_label)
         
@@ -431,7 +445,7 @@ class View(QMainWindow):
         
         # Add connection details indicator
         self.connection_status = QLabel("Not Connected")
-        self.connection_status.setFont(QFont("Arial", 18))
+        self.connection_status.setFont(LABEL_FONT)
         self.connection_status.setAlignment(Qt.AlignCenter)
         self.connection_status.setStyleSheet("color: #ef4444;")
         controlLayout.addWidget(self.connection_status)
@@ -482,7 +496,6 @@ class View(QMainWindow):
         # Create chart views if they don't exist
         if not hasattr(self, 'breathView'):
             self.breathView = QChartView(self.chart_breath)
-            self.breathView.setRenderHint(QPainter.Antialiasing)
             self.breathView.setStyleSheet("background-color: transparent;")
             
         if not hasattr(self, 'hrvView'):
@@ -502,72 +515,130 @@ class View(QMainWindow):
         QTimer.singleShot(100, self.update_circles_background)
 
     def start_view_update(self):
-        self.update_series_timer = QTimer()
-        self.update_series_timer.timeout.connect(self.update_series)
-        self.update_series_timer.start(self.UPDATE_SERIES_PERIOD)
-
-        self.update_acc_timer = QTimer()
-        self.update_acc_timer.timeout.connect(self.update_acc_series)
-        self.update_acc_timer.start(self.UPDATE_BREATHING_SERIES_PERIOD)
+        # One timer drives all charts: the breathing series on every tick, the others on every n-th
+        self.update_tick = 0
+        self.update_timer = QTimer()
+        self.update_timer.timeout.connect(self.update_charts)
+        self.update_timer.start(self.UPDATE_BREATHING_SERIES_PERIOD)
 
         self.pacer_timer = QTimer()
         self.pacer_timer.timeout.connect(self.plot_circles)
         self.pacer_timer.start(self.UPDATE_PACER_PERIOD)
 
-        self.bpm_timer = QTimer()
-        self.bpm_timer.timeout.connect(self.update_bpm_series)
-        self.bpm_timer.start(self.UPDATE_SERIES_PERIOD)
+    def update_charts(self):
+        self.update_acc_series()
+        if self.update_tick % (self.UPDATE_SERIES_PERIOD // self.UPDATE_BREATHING_SERIES_PERIOD) == 0:
+            self.update_series()
+        self.update_tick += 1
+
+    def _is_shown(self, view):
+        """Returns True if the view is on screen, i.e. visible and the window is not minimized."""
+        return view.isVisible() and not self.isMinimized()
+
+    def _needs_redraw(self, key, history, view, time_range):
+        """
+        Returns True if the view is shown and the history changed since it was last drawn,
+        or the series has scrolled by at least one pixel of the chart's plot area.
+        """
+        if not self._is_shown(view):
+            return False
+        now = time.monotonic()
+        last_version, last_time = self.last_drawn.get(key, (None, 0.0))
+        seconds_per_pixel = time_range / max(view.chart().plotArea().width(), 1.0)
+        if history.version == last_version and (history.count == 0 or now - last_time < seconds_per_pixel):
+            return False
+        self.last_drawn[key] = (history.version, now)
+        return True
 
     def update_pacer_rate(self):
-        self.pacer_rate = self.rate_slider.value()
+        rate = self.rate_slider.value()
+        if rate == self.pacer_rate:
+            return
+        self.pacer_rate = rate
         self.rate_label.setText(f"Breathing rate: {self.pacer_rate} bpm")
 
     def plot_circles(self):
-        coords = self.model.pacer.update(self.pacer_rate)
-        self.circles.update_pacer_series(*coords)
+        # Read the clock once per tick, for both the pacer phase and the pacer history
+        t_ns = time.monotonic_ns() - self.pacer_t0_ns
+        radius = self.model.pacer.update(self.pacer_rate, t_ns * 1e-9)
+        self.circles.update_pacer_series(radius)
 
-        self.pacer_values_hist = np.roll(self.pacer_values_hist, -1)
-        self.pacer_values_hist[-1] = np.linalg.norm([coords[0][0], coords[1][0]]) - 0.5
-        self.pacer_times_hist = np.roll(self.pacer_times_hist, -1)
-        self.pacer_times_hist[-1] = time.time_ns() / 1e9
+        i = self._pacer_idx
+        self.pacer_values_hist[i] = radius - 0.5
+        self.pacer_times_hist[i] = t_ns
+        self._pacer_idx = (i + 1) % self.PACER_HIST_SIZE
+        self._pacer_count = min(self._pacer_count + 1, self.PACER_HIST_SIZE)
 
-        breath_coords = self.model.breath_analyser.get_breath_circle_coords()
-        self.circles.update_breath_series(*breath_coords)
+        self.circles.update_breath_series(self.model.breath_analyser.get_breath_circle_radius())
 
     def update_acc_series(self):
-        self.pacer_times_hist_rel_s = self.pacer_times_hist - time.time_ns() / 1e9
-
-        acc_pts = self.model.breath_analyser.chest_acc_history.get_qpoint_list()
-        self.series_breath_acc.replace(acc_pts)
-        cyc_pts = self.model.breath_analyser.chest_acc_history.get_qpoint_marker_list()
-        self.series_breath_cycle.replace(cyc_pts)
-
-        pacer_pts = [
-            QPointF(t, v)
-            for t, v in zip(
-                self.pacer_times_hist_rel_s.flatten(),
-                self.pacer_values_hist.flatten()
+        if not self._is_shown(self.breathView):
+            return
+
+        # Unroll the valid part of the pacer ring buffers into the preallocated buffers, oldest
+        # sample first: the tail from the write index (only filled once wrapped), then the head
+        i = self._pacer_idx
+        count = self._pacer_count
+        n_tail = count - i
+        tail = slice(self.PACER_HIST_SIZE - n_tail, self.PACER_HIST_SIZE)
+        now_ns = time.monotonic_ns() - self.pacer_t0_ns
+        pacer_times_rel_s = self.pacer_times_hist_rel_s[:count]
+        pacer_values = self.pacer_values_unrolled[:count]
+        np.subtract(self.pacer_times_hist[tail], now_ns, out=pacer_times_rel_s[:n_tail])
+        np.subtract(self.pacer_times_hist[:i], now_ns, out=pacer_times_rel_s[n_tail:])
+        pacer_times_rel_s *= 1e-9
+        pacer_values[:n_tail] = self.pacer_values_hist[tail]
+        pacer_values[n_tail:] = self.pacer_values_hist[:i]
+
+        chest_acc_history = self.model.breath_analyser.chest_acc_history
+
+        if self._needs_redraw("breath_acc", chest_acc_history, self.breathView, self.BREATH_ACC_TIME_RANGE):
+            # Reduce to a min/max pair per horizontal pixel of the visible window
+            acc_xy = chest_acc_history.get_decimated_minmax(
+                int(self.chart_breath.plotArea().width()), time.time() - self.BREATH_ACC_TIME_RANGE
             )
-            if not np.isnan(t)
-        ]
-        if pacer_pts:
-            self.series_pacer.replace(pacer_pts)
+            replace_series(self.series_breath_acc, *acc_xy.T)
+            replace_series(self.series_breath_cycle, *chest_acc_history.get_marker_xy_array().T)
 
-    def update_series(self):
-        hr_pts = self.model.hrv_analyser.hr_history.get_qpoint_list()
-        self.series_hr.replace(hr_pts)
-
-        br_pts = self.model.breath_analyser.br_history.get_qpoint_list()
-        self.series_br.replace(br_pts)
-        self.series_br_marker.replace(br_pts)
+        if count:
+            # The pacer is smooth, so two points per horizontal pixel are plenty
+            replace_series(self.series_pacer, *downsample(
+                pacer_times_rel_s, pacer_values, 2 * self.chart_breath.plotArea().width()
+            ))
 
-        mm_pts = self.model.hrv_analyser.maxmin_history.get_qpoint_list()
-        self.series_maxmin.replace(mm_pts)
-        self.series_maxmin_marker.replace(mm_pts)
+    def update_series(self):
+        hr_history = self.model.hrv_analyser.hr_history
+        br_history = self.model.breath_analyser.br_history
+        maxmin_history = self.model.hrv_analyser.maxmin_history
+        redraw_hr = self._needs_redraw("hr", hr_history, self.breathView, self.BREATH_ACC_TIME_RANGE)
+        redraw_br = self._needs_redraw("br", br_history, self.hrvView, self.HRV_SERIES_TIME_RANGE)
+        redraw_maxmin = self._needs_redraw("maxmin", maxmin_history, self.hrvView, self.HRV_SERIES_TIME_RANGE)
+        redraw_bpm = self._needs_redraw("bpm", hr_history, self.bpm_view, self.HRV_SERIES_TIME_RANGE)
+
+        if redraw_hr:
+            hr_xy = hr_history.get_xy_array()
+            replace_series(self.series_hr, *hr_xy.T)
+
+        if redraw_br:
+            br_xy = br_history.get_xy_array()
+            replace_series(self.series_br, *br_xy.T)
+            replace_series(self.series_br_marker, *br_xy.T)
+
+        if redraw_maxmin:
+            mm_xy = maxmin_history.get_xy_array()
+            replace_series(self.series_maxmin, *mm_xy.T)
+            replace_series(self.series_maxmin_marker, *mm_xy.T)
+
+        # The BPM chart refreshes at the same period, so it shares this timer
+        if redraw_bpm:
+            self.update_bpm_series()
 
     @Slot()
     def _on_scan_button_press(self):
-        asyncio.create_task(self.sensor_handler.scan())
+        # Don't start overlapping scans
+        if self.scan_task and not self.scan_task.done():
+            return
+        self.scan_task = asyncio.create_task(self.sensor_handler.scan())
 
     @Slot()
     def _on_scan_complete(self):
@@ -580,7 +651,7 @@ class View(QMainWindow):
     def _on_connect_button_press(self):
         selected_device = self.sensor_combo.currentText()
         sensor = self.sensor_handler.create_sensor_client(selected_device)
-        asyncio.create_task(self.set_sensor(sensor))
+        self.connect_task = asyncio.create_task(self.set_sensor(sensor))
 
     async def set_sensor(self, sensor):
         try:
@@ -599,8 +670,16 @@ class View(QMainWindow):
 
     def handleResize(self, event):
         """Handle window resize events to adjust layout as needed."""
-        width = event.size().width()
-        
+        # Coalesce the resize events of a window drag into one layout update
+        self.resize_timer.start(150)
+
+        # Pass event to parent class
+        super().resizeEvent(event)
+
+    def _apply_compact_mode(self):
+        """Switch compact mode on or off for the current window width."""
+        width = self.width()
+
         # Check if we should switch to compact mode (width < 1000px)
         new_compact_mode = width < 1000
         
@@ -616,9 +695,6 @@ class View(QMainWindow):
             
             # Auto-adjust chart axes for better display in compact mode
             self._update_chart_for_compact_mode()
-        
-        # Pass event to parent class
-        super().resizeEvent(event)
     
     def _update_chart_for_compact_mode(self):
         """Adjust chart properties for compact mode."""
@@ -653,4 +729,4 @@ class View(QMainWindow):
     def update_circles_background(self):
         """Force update of the circles background image"""
         if hasattr(self, 'circles'):
-            self.circles.apply_background_image_to_chart()
\ No newline at end of file
+            self.circles.apply_background_image()
\ No newline at end of file
@@ -7,9 +7,6 @@ class BreathAnalyser:
 
     def __init__(self):
         self.breathing_circle_radius = -0.5
-        theta = np.linspace(0, 2 * np.pi, 40)
-        self.cos_theta = np.cos(theta)
-        self.sin_theta = np.sin(theta)
 
         self.BR_ACC_HIST_SIZE = 10000 # Up to 16 minutes at 10 Hz
         self.BR_HIST_SIZE = 500 
@@ -99,20 +96,16 @@ class BreathAnalyser:
         '''
         return (self.br_history.times[-2], self.br_history.times[-1])
 
-    def get_breath_circle_coords(self):
+    def get_breath_circle_radius(self):
         '''
-        Returns the x,y coordinates of a circle whos radius tracks chest acc
-        TODO: Move this to a visualisation widget
+        Returns the radius of a circle that tracks chest acc, between 0 and 1
         '''
         if not self.chest_acc_history.is_empty():
             self.breathing_circle_radius = 0.7*self.chest_acc_history.values[-1] + (1-0.7)*self.breathing_circle_radius
         else: 
             self.breathing_circle_radius = -0.5
-        self.breathing_circle_radius = np.min([np.max([self.breathing_circle_radius + 0.5, 0]), 1])
-
-        x = self.breathing_circle_radius * self.cos_theta
-        y = self.breathing_circle_radius * self.sin_theta
-        return (x, y)
+        self.breathing_circle_radius = min(max(self.breathing_circle_radius + 0.5, 0.0), 1.0)
+        return self.breathing_circle_radius
 
     def update_breathing_spectrum(self):
         '''
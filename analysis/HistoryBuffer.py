@@ -1,16 +1,21 @@
 
 import numpy as np
 import time
-from PySide6.QtCore import QPointF
+
 class HistoryBuffer:
 
-    def __init__(self, buffer_size):
+    def __init__(self, buffer_size, dtype=np.float64):
         '''
         Rolling history buffer of values, times is in epoch seconds
+        dtype sets the storage type of values, e.g. int16 for raw signals; integer buffers are
+        zero padded instead of NaN padded, so only the written samples (get_v) are meaningful
         '''        
-        self.values = np.full(buffer_size, np.nan)
+        fill_value = np.nan if np.issubdtype(dtype, np.floating) else 0
+        self.values = np.full(buffer_size, fill_value, dtype=dtype)
         self.times = np.full(buffer_size, np.nan)
         self.markers = np.full(buffer_size, -1, dtype=int) # To store indices of interest for values/times
+        self.count = 0 # Number of samples written, up to buffer_size
+        self.version = 0 # Incremented on every change, so readers can skip unchanged buffers
 
     def update(self, new_time, new_value):
         '''
@@ -21,16 +26,53 @@ class HistoryBuffer:
         self.times[-1] = new_time
         self.values = np.roll(self.values, -1)
         self.values[-1] = new_value
+        self.count = min(self.count + 1, len(self.values))
+        self.version += 1
 
         self.markers = self.markers - 1 # Index of marker shifts with the rolling buffers
         self.markers[self.markers < -1] = -1
 
+    def update_batch(self, new_times, new_values):
+        '''
+        Adds a block of values and timestamps to the end of the buffer in a single shift
+        Equivalent to calling update for each sample, without the per-sample roll
+        '''
+        n = min(len(new_times), len(self.times))
+        if n == 0:
+            return
+        self.times = np.roll(self.times, -n)
+        self.times[-n:] = new_times[-n:]
+        self.values = np.roll(self.values, -n)
+        self.values[-n:] = new_values[-n:]
+        self.count = min(self.count + n, len(self.values))
+        self.version += 1
+
+        self.markers = self.markers - n
+        self.markers[self.markers < -1] = -1
+
     def add_marker(self, index):
         '''
         Adds a marker to the specified index
         '''
         self.markers = np.roll(self.markers, -1)
         self.markers[-1] = index
+        self.version += 1
+
+    def get_t(self):
+        '''
+        Returns a read-only view of the times written so far, oldest first
+        '''
+        t = self.times[len(self.times) - self.count:]
+        t.flags.writeable = False
+        return t
+
+    def get_v(self):
+        '''
+        Returns a read-only view of the values written so far, oldest first
+        '''
+        v = self.values[len(self.values) - self.count:]
+        v.flags.writeable = False
+        return v
 
     def get_relative_times(self):
         '''
@@ -38,49 +80,80 @@ class HistoryBuffer:
         '''
         return self.times - time.time_ns()/1.0e9
 
-    def get_qpoint_list(self, use_relative_time=True):
+    def get_xy_array(self):
+        '''
+        Returns an (N, 2) array of relative times and non-NaN values
+        The array is column-major, so each column is a contiguous block for QXYSeries.replaceNp
+        '''
+        times, values = self.get_t(), self.get_v()
+        ids = ~np.isnan(values)
+        return self._to_relative_xy(times[ids], values[ids])
+
+    def get_marker_xy_array(self):
         '''
-        Returns a list of QPointF, for using with Qseries.replace
+        Returns an (N, 2) array of relative times and values at the marker indices
         '''
-        series = []
-        rel_t = self.get_relative_times()
-        for i, value in enumerate(self.values):
-            if not np.isnan(value):
-                series.append(QPointF(rel_t[i], value))
-        return series
+        marker_ids = self.markers[self.markers >= 0]
+        return self._to_relative_xy(self.times[marker_ids], self.values[marker_ids])
 
-    def get_qpoint_marker_list(self, use_relative_time=True):
+    def get_decimated_minmax(self, out_width, t_start=None):
         '''
-        Returns a list of QPointF of values at the marker indices
+        Returns an (N, 2) array like get_xy_array, reduced to the minimum and maximum of each of
+        out_width time-ordered bins, so the signal envelope is kept with at most 2*out_width points
+        Only samples at or after t_start (epoch seconds) are included, if given
         '''
-        series = []
-        rel_t = self.get_relative_times()
-        for _, marker_id in enumerate(self.markers):
-            if marker_id >= 0:
-                series.append(QPointF(rel_t[marker_id], self.values[marker_id]))
-        return series
+        times, values = self.get_t(), self.get_v()
+        if t_start is not None:
+            first = np.searchsorted(times, t_start)
+            times, values = times[first:], values[first:]
+        ids = ~np.isnan(values)
+        times, values = times[ids], values[ids]
+
+        bin_size = len(values) // max(out_width, 1)
+        if bin_size < 2:
+            return self._to_relative_xy(times, values)
+
+        # Drop the oldest samples that don't fill a bin, then take both extremes of each bin in time order
+        n_bins = len(values) // bin_size
+        times, values = times[-n_bins * bin_size:], values[-n_bins * bin_size:]
+        bins = values.reshape(n_bins, bin_size)
+        ids_min = np.argmin(bins, axis=1)
+        ids_max = np.argmax(bins, axis=1)
+        bin_starts = np.arange(n_bins) * bin_size
+        ids = np.empty((n_bins, 2), dtype=int)
+        ids[:, 0] = bin_starts + np.minimum(ids_min, ids_max)
+        ids[:, 1] = bin_starts + np.maximum(ids_min, ids_max)
+        ids = ids.ravel()
+        return self._to_relative_xy(times[ids], values[ids])
+
+    def _to_relative_xy(self, times, values):
+        xy = np.empty((len(values), 2), order='F')
+        np.subtract(times, time.time_ns()/1.0e9, out=xy[:, 0])
+        xy[:, 1] = values
+        return xy
 
     def get_values_range(self, rel_t_range):
         '''
         Returns the range of the values in the specified relative time range
         '''
-        rel_t = self.get_relative_times()
+        times, values = self.get_t(), self.get_v()
+        rel_t = times - time.time_ns()/1.0e9
         ids = (rel_t > rel_t_range[0]) & (rel_t <= rel_t_range[1])
         if not self.is_empty():
-            min = np.floor(np.nanmin(self.values[ids]))
-            max = np.ceil(np.nanmax(self.values[ids]))
+            min = np.floor(np.nanmin(values[ids]))
+            max = np.ceil(np.nanmax(values[ids]))
             return (min, max)        
         else:
             return None
 
     def is_empty(self):
-        return np.isnan(self.values).all()
+        return np.isnan(self.get_v()).all()
     
     def n_values(self):
-        return np.count_nonzero(~np.isnan(self.values))
+        return np.count_nonzero(~np.isnan(self.get_v()))
 
     def is_full(self):
-        return not np.isnan(self.values).any()
+        return self.count == len(self.values) and not np.isnan(self.values).any()
 
     def get_sub_buffer(self, t_start, t_end):
         '''
@@ -91,11 +164,10 @@ class HistoryBuffer:
         sub_times = self.times[mask]
 
         sub_buffer_size = len(sub_values)
-        sub_buffer = HistoryBuffer(sub_buffer_size)
+        sub_buffer = HistoryBuffer(sub_buffer_size, dtype=self.values.dtype)
 
         # Add the filtered values and times to the new buffer
-        sub_buffer.values[:sub_buffer_size] = sub_values
-        sub_buffer.times[:sub_buffer_size] = sub_times
+        sub_buffer.update_batch(sub_times, sub_values)
 
         # Handle markers within the specified range
         sub_buffer.markers = np.full(sub_buffer_size, -1, dtype=int)
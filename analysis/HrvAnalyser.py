@@ -5,8 +5,8 @@ from scipy import signal
 def ibi_to_hr(ibi):
     return 60.0/(ibi/1000.0)
 
-def calculate_rmssd(ibi, ibi_shifted):    
-    return np.sqrt(np.mean((ibi - ibi_shifted)**2))
+def calculate_rmssd(ibi):
+    return np.sqrt(np.mean(np.diff(ibi)**2))
 
 def calculate_maxmin(ibi):
     return np.max(ibi) - np.min(ibi)
@@ -87,9 +87,12 @@ class HrvAnalyser:
         
         ibi_ids = self.ibi_history.times > t_range[0]
         ibi_values = self.ibi_history.values[ibi_ids]
-        ibi_values_shifted = np.roll(self.ibi_history.values, 1)[ibi_ids]
-        
-        rmssd = calculate_rmssd(ibi_values, ibi_values_shifted)
+
+        # Successive differences start from the beat preceding the breath
+        first_id = np.argmax(ibi_ids)
+        ibi_successive = self.ibi_history.values[first_id - 1:] if first_id > 0 else ibi_values
+
+        rmssd = calculate_rmssd(ibi_successive)
         maxmin = calculate_maxmin(ibi_values)
         sdnn = calculate_sdnn(ibi_values)
 
@@ -28,7 +28,9 @@ class SensorHandler(QObject):
         while len(self.valid_devices) == 0: # Loop until supported device is found
             ble_devices = await BleakScanner.discover()
 
-            supported_devices = blehrm.get_supported_devices(ble_devices)
+            # Devices are selected by name, so unnamed advertisers can be skipped before matching
+            named_devices = [device for device in ble_devices if device.name]
+            supported_devices = blehrm.get_supported_devices(named_devices)
             
             self.valid_devices = {device.name: device for device, device_type in supported_devices}
             self.logger.info(f"Found {len(ble_devices)} BLE devices, {len(self.valid_devices)} of which were valid")
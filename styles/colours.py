@@ -1,4 +1,5 @@
-from PySide6.QtGui import QColor
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QColor, QFont, QPen
 
 # Plot parameters
 RED = QColor(239, 68, 68)        # Using a shade close to error-color
@@ -16,4 +17,34 @@ TEXT_COLOR = QColor(255, 255, 255) # Using text-primary
 # Line parameters
 LINEWIDTH = 2.5
 DOTSIZE_SMALL = 5
-DOTSIZE_LARGE = 7
\ No newline at end of file
+DOTSIZE_LARGE = 7
+NO_PEN = QPen(Qt.NoPen)
+
+# Fonts, shared by all widgets (Qt copies fonts on assignment)
+TITLE_FONT = QFont("Arial", 21, QFont.Bold)
+LABEL_FONT = QFont("Arial", 18)
+CONTROL_FONT = QFont("Arial", 11)
+VALUE_FONT = QFont("Arial", 28, QFont.Bold)
+RATE_FONT = QFont("Arial", 21)
+
+# Stylesheet shared by the scan and connect buttons
+ACTION_BUTTON_QSS = """
+    QPushButton#actionButton {
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #D23888, stop:1 #e76c9e);
+        border-radius: 8px;
+        padding: 8px 16px;
+        color: white;
+        text-align: left;
+        border: none;
+    }
+    QPushButton#actionButton:hover {
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #e358a2, stop:1 #f086b5);
+    }
+    QPushButton#actionButton:pressed {
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #b22a74, stop:1 #c75689);
+    }
+    QPushButton#actionButton:disabled {
+        background: #444444;
+        color: #888888;
+    }
+"""
@@ -1,6 +1,8 @@
 
+import functools
 from PySide6.QtCore import QFile
 
+@functools.lru_cache(maxsize=8)
 def get_stylesheet(style_file):
     """
     Returns the stylesheet from a .qss file
@@ -1,20 +1,44 @@
-from PySide6.QtCore import Qt, QMargins
+import functools
+import numpy as np
+from PySide6.QtCore import Qt, QMargins, QPointF
 from PySide6.QtWidgets import (
     QVBoxLayout, QHBoxLayout, QSlider, QLabel,
     QWidget, QComboBox, QPushButton, QGraphicsDropShadowEffect
 )
-from PySide6.QtCharts import QChartView, QChart, QLineSeries, QScatterSeries, QSplineSeries, QAreaSeries, QValueAxis
+from PySide6.QtCharts import QChartView, QChart, QXYSeries, QLineSeries, QScatterSeries, QSplineSeries, QAreaSeries, QValueAxis
 from PySide6.QtGui import QPen, QPainter, QColor, QFont, QBrush, QGradient
 from styles.colours import DARK_BG, CHART_BG, TEXT_COLOR
 
-def create_chart(title=None, showTitle=True, showLegend=False):
+# Bulk replace from NumPy buffers, available in recent PySide6 builds
+_HAS_REPLACE_NP = hasattr(QXYSeries, "replaceNp")
+
+# Shared chart and axis styling, built once at import
+_TEXT_BRUSH = QBrush(TEXT_COLOR)
+_GRID_COLOR = QColor(70, 70, 70)
+_AXIS_PEN = QPen(QColor(120, 120, 120))
+_CHART_BRUSH = QBrush(CHART_BG)
+_PLOT_AREA_BRUSH = QBrush(CHART_BG.darker(110))
+_PLOT_BORDER_PEN = QPen(_GRID_COLOR, 1)
+_SHADOW_COLOR = QColor(0, 0, 0, 80)
+
+@functools.lru_cache(maxsize=None)
+def _font(size, bold=False):
+    """Returns a shared Arial font; Qt copies fonts on assignment, so sharing is safe."""
+    font = QFont("Arial", size)
+    font.setBold(bold)
+    return font
+
+def create_chart(title=None, showTitle=True, showLegend=False, shadow=False):
     """Creates a chart with dark theme styling."""
     chart = QChart()
     
     # Dark mode styling
-    chart.setBackgroundBrush(QBrush(CHART_BG))
+    chart.setBackgroundBrush(_CHART_BRUSH)
     chart.setBackgroundRoundness(8)
     chart.setBackgroundPen(Qt.NoPen)
+
+    # Series are replaced several times per second, so never animate the transitions
+    chart.setAnimationOptions(QChart.NoAnimation)
     
     # Remove default margins to maximize chart area
     chart.setMargins(QMargins(0, 0, 0, 0))
@@ -22,29 +46,28 @@ def create_chart(title=None, showTitle=True, showLegend=False):
     
     # Add padding only inside the plot area
     chart.setPlotAreaBackgroundVisible(True)
-    chart.setPlotAreaBackgroundBrush(QBrush(CHART_BG.darker(110)))
-    chart.setPlotAreaBackgroundPen(QPen(QColor(70, 70, 70), 1))
+    chart.setPlotAreaBackgroundBrush(_PLOT_AREA_BRUSH)
+    chart.setPlotAreaBackgroundPen(_PLOT_BORDER_PEN)
     
     if title and showTitle:
         chart.setTitle(title)
-        title_font = QFont("Arial", 18, QFont.Bold)
-        chart.setTitleFont(title_font)
-        chart.setTitleBrush(QBrush(TEXT_COLOR))
+        chart.setTitleFont(_font(18, bold=True))
+        chart.setTitleBrush(_TEXT_BRUSH)
     
     chart.legend().setVisible(showLegend)
     if showLegend:
         chart.legend().setLabelColor(TEXT_COLOR)
-        legend_font = QFont("Arial", 14)
-        chart.legend().setFont(legend_font)
+        chart.legend().setFont(_font(14))
         # Position legend at the bottom to save horizontal space
         chart.legend().setAlignment(Qt.AlignBottom)
     
-    # Add drop shadow for modern look
-    shadow = QGraphicsDropShadowEffect()
-    shadow.setBlurRadius(15)
-    shadow.setColor(QColor(0, 0, 0, 80))
-    shadow.setOffset(3, 3)
-    chart.setGraphicsEffect(shadow)
+    # Optional drop shadow for modern look; it blurs the whole chart on every repaint
+    if shadow:
+        effect = QGraphicsDropShadowEffect()
+        effect.setBlurRadius(15)
+        effect.setColor(_SHADOW_COLOR)
+        effect.setOffset(3, 3)
+        chart.setGraphicsEffect(effect)
     
     return chart
 
@@ -75,32 +98,48 @@ def create_spline_series(color=None, width=1.0):
         series.setPen(pen)
     return series
 
+def replace_series(series, xs, ys):
+    """Replaces the points of an XY series with the given x and y arrays."""
+    # replaceNp needs contiguous arrays of matching dtype, otherwise it silently drops the data
+    xs = np.ascontiguousarray(xs, dtype=np.float64)
+    ys = np.ascontiguousarray(ys, dtype=np.float64)
+    if _HAS_REPLACE_NP:
+        series.replaceNp(xs, ys)
+    else:
+        # Older PySide6 builds: build the points in C via map over plain float lists
+        series.replace(list(map(QPointF, xs.tolist(), ys.tolist())))
+
+def downsample(xs, ys, n_target):
+    """Strides the x and y arrays down to about n_target points, always keeping the latest point."""
+    step = len(xs) // max(int(n_target), 1)
+    if step <= 1:
+        return xs, ys
+    start = (len(xs) - 1) % step
+    return xs[start::step], ys[start::step]
+
 def create_axis(title=None, color=None, tickCount=None, 
               labelFormat=None, rangeMin=None, rangeMax=None, labelSize=None, 
-              flip=None):
+              flip=None, gridLines=True):
     """Creates a chart axis with dark theme styling."""
     axis = QValueAxis()
     
     if title:
         axis.setTitleText(title)
-        title_brush = QBrush(TEXT_COLOR if color is None else color)
-        axis.setTitleBrush(title_brush)
+        axis.setTitleBrush(_TEXT_BRUSH if color is None else QBrush(color))
         if labelSize:
-            title_font = QFont("Arial", labelSize, QFont.Bold)
-            axis.setTitleFont(title_font)
+            axis.setTitleFont(_font(labelSize, bold=True))
     
     # Dark mode styling for grid lines and labels
-    axis.setGridLineColor(QColor(70, 70, 70))  # Darker grid lines
-    axis.setGridLineVisible(True)
+    axis.setGridLineColor(_GRID_COLOR)  # Darker grid lines
+    axis.setGridLineVisible(gridLines)
     axis.setMinorGridLineVisible(False)  # Turn off minor grid lines to reduce clutter
     axis.setLabelsColor(TEXT_COLOR)
-    axis.setLinePen(QPen(QColor(120, 120, 120)))  # Axis line color
+    axis.setLinePen(_AXIS_PEN)  # Axis line color
     
     # Optimize label size for compact views
     if labelSize:
         labelSize = min(labelSize, 16)  # Cap label size for compact views
-        label_font = QFont("Arial", labelSize)
-        axis.setLabelsFont(label_font)
+        axis.setLabelsFont(_font(labelSize))
     
     # Reduce the number of tick marks in compact views
     if tickCount:
@@ -117,4 +156,9 @@ def create_axis(title=None, color=None, tickCount=None,
     if flip is not None:
         axis.setReverse(flip)
     
-    return axis
\ No newline at end of file
+    return axis
+
+def create_time_axis(time_range, labelSize=16, gridLines=True):
+    """Creates an unlabelled time axis spanning the last time_range seconds, ending at 0."""
+    return create_axis(None, tickCount=10, rangeMin=-time_range, rangeMax=0, labelSize=labelSize,
+                       gridLines=gridLines)
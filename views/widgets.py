@@ -1,35 +1,54 @@
-from PySide6.QtCore import Qt, QMargins, QSize
-from PySide6.QtWidgets import QSizePolicy, QWidget, QGraphicsDropShadowEffect
-from PySide6.QtCharts import QChart, QChartView, QValueAxis, QSplineSeries, QAreaSeries
+from PySide6.QtCore import Qt, QSize, QTimer, QRectF, QPointF
+from PySide6.QtWidgets import QSizePolicy, QWidget
 from PySide6.QtGui import QPen, QColor, QBrush, QRadialGradient, QGradient, QPainter, QPixmap, QIcon
 import os
+import logging
+from collections import OrderedDict
 
 from styles.colours import DARK_BG, CHART_BG
 
 
-class CirclesWidget(QChartView):
-    def __init__(self, x_values=None, y_values=None, pacer_color=None, breathing_color=None, hr_color=None, background_image=None):
+class CirclesWidget(QWidget):
+    """Draws the pacer and breathing disks over a background, painted directly with QPainter."""
+
+    def __init__(self, pacer_color=None, breathing_color=None, hr_color=None, background_image=None,
+                 shadow=False):
         super().__init__()
+        self.logger = logging.getLogger(__name__)
+
+        # Disk radii, as a fraction of half the widget's side
+        self.pacer_radius = 0.0
+        self.breath_radius = 0.0
+
+        # Repaint at most once per display frame, however often the radii are updated,
+        # and only while they are changing
+        self.RENDER_PERIOD = 16 # ms
+        self.render_timer = QTimer(self)
+        self.render_timer.setSingleShot(True)
+        self.render_timer.setInterval(self.RENDER_PERIOD)
+        self.render_timer.timeout.connect(self.update)
+
+        # Composed backgrounds by (image, size), most recently used last
+        self.BG_CACHE_SIZE = 4
+        self.bg_cache = OrderedDict()
+        # Background image pre-scaled to the size last drawn
+        self.scaled_bg = None
+        self.scaled_bg_size = None
+        # Recompose the background once resizing settles, rather than on every resize event
+        self.bg_timer = QTimer(self)
+        self.bg_timer.setSingleShot(True)
+        self.bg_timer.timeout.connect(self.apply_background_image)
+        # Background size, snapped to the grid, the background was last scheduled for
+        self.bg_snapped_size = None
 
         # Background image
         self.background_image = None
         if background_image:
-            # Make sure the image file exists
             if os.path.exists(background_image):
-                print(f"Image file exists at path: {background_image}")
                 self.background_image = QPixmap(background_image)
-                print(f"Image loaded successfully: {not self.background_image.isNull()}")
-                print(f"Image dimensions: {self.background_image.width()}x{self.background_image.height()}")
             else:
-                print(f"ERROR: Image file does not exist at path: {background_image}")
-                print(f"Current working directory: {os.getcwd()}")
-                # Try to find the image in nearby directories
-                for root, dirs, files in os.walk('.', topdown=True):
-                    for file in files:
-                        if file == os.path.basename(background_image):
-                            full_path = os.path.join(root, file)
-                            print(f"Found similar file at: {full_path}")
-        
+                self.logger.warning(f"Background image missing: {background_image}")
+
         # Enforce square aspect ratio via sizeHint
         self.setSizePolicy(
             QSizePolicy(
@@ -38,46 +57,29 @@ class CirclesWidget(QChartView):
             )
         )
 
-        # Dark mode styling
-        self.setBackgroundBrush(QBrush(DARK_BG))
-        self.scene().setBackgroundBrush(QBrush(DARK_BG))
-        self.setAlignment(Qt.AlignCenter)
-
-        # Create chart
-        self.plot = QChart()
-        self.plot.legend().setVisible(False)
-        self.plot.setBackgroundRoundness(10)
-        self.plot.setMargins(QMargins(0, 0, 0, 0))
+        # Optional drop shadow, baked into a pixmap per widget size rather than blurred on every repaint
+        self.shadow = shadow
+        self.SHADOW_OFFSET = 3
+        self.SHADOW_MARGIN = 10 # Room left for the shadow on the bottom right
+        self.shadow_pixmap = None
 
-        # Set up chart background
+        # Set up background
         if self.background_image and not self.background_image.isNull():
-            # Use the image as chart background with gradient overlay
-            self.apply_background_image_to_chart()
+            # Use the image as background with gradient overlay
+            self.apply_background_image()
         else:
-            # Chart radial gradient background (fallback)
+            # Radial gradient background (fallback)
             gradient = QRadialGradient(0.5, 0.5, 0.5)
             gradient.setCoordinateMode(QGradient.ObjectBoundingMode)
             gradient.setColorAt(0, QColor(50, 50, 60))
             gradient.setColorAt(1, QColor(30, 30, 40))
-            self.plot.setBackgroundBrush(QBrush(gradient))
+            self.background_brush = QBrush(gradient)
 
         # Subtle border
-        borderPen = QPen(QColor(80, 80, 90))
-        borderPen.setWidth(1)
-        self.plot.setBackgroundPen(borderPen)
-
-        # Drop shadow effect
-        shadow = QGraphicsDropShadowEffect()
-        shadow.setBlurRadius(15)
-        shadow.setColor(QColor(0, 0, 0, 60))
-        shadow.setOffset(3, 3)
-        self.setGraphicsEffect(shadow)
+        self.border_pen = QPen(QColor(80, 80, 90))
+        self.border_pen.setWidth(1)
 
         # --- Pacer Disk ---
-        self.pacer_circumference_coord = QSplineSeries()
-        self.disk = QAreaSeries(self.pacer_circumference_coord)
-        # Remove outline stroke
-        self.disk.setPen(QPen(Qt.NoPen))
         # Gradient fill based on pacer_color
         if pacer_color:
             diskGradient = QRadialGradient(0, 0, 1)
@@ -86,16 +88,11 @@ class CirclesWidget(QChartView):
             dark = QColor(pacer_color).darker(150); dark.setAlpha(150)
             diskGradient.setColorAt(0, glow)
             diskGradient.setColorAt(1, dark)
-            self.disk.setBrush(QBrush(diskGradient))
+            self.disk_brush = QBrush(diskGradient)
         else:
-            self.disk.setBrush(QBrush(QColor(120, 120, 180, 180)))
-        self.plot.addSeries(self.disk)
+            self.disk_brush = QBrush(QColor(120, 120, 180, 180))
 
         # --- Breathing Disk ---
-        self.breath_circumference_coord = QSplineSeries()
-        self.breath_disk = QAreaSeries(self.breath_circumference_coord)
-        # Remove outline stroke from breath disk
-        self.breath_disk.setPen(QPen(Qt.NoPen))
         # Gradient fill for breath disk
         if breathing_color:
             breathGradient = QRadialGradient(0, 0, 1)
@@ -104,68 +101,75 @@ class CirclesWidget(QChartView):
             dark = QColor(breathing_color).darker(200); dark.setAlpha(100)
             breathGradient.setColorAt(0, glow)
             breathGradient.setColorAt(1, dark)
-            self.breath_disk.setBrush(QBrush(breathGradient))
+            self.breath_disk_brush = QBrush(breathGradient)
         else:
-            self.breath_disk.setBrush(QBrush(QColor(180, 180, 240, 120)))
-        self.plot.addSeries(self.breath_disk)
-
-        # Initialize series data if provided
-        if x_values is not None and y_values is not None:
-            self._instantiate_series(x_values, y_values)
-
-        # --- Axes setup (hidden) ---
-        self.x_axis = QValueAxis()
-        self.x_axis.setRange(-1, 1)
-        self.x_axis.setVisible(False)
-        self.plot.addAxis(self.x_axis, Qt.AlignBottom)
-        self.disk.attachAxis(self.x_axis)
-        self.breath_disk.attachAxis(self.x_axis)
-
-        self.y_axis = QValueAxis()
-        self.y_axis.setRange(-1, 1)
-        self.y_axis.setVisible(False)
-        self.plot.addAxis(self.y_axis, Qt.AlignLeft)
-        self.disk.attachAxis(self.y_axis)
-        self.breath_disk.attachAxis(self.y_axis)
-
-        self.setChart(self.plot)
-        self.setRenderHint(QPainter.Antialiasing, True)
-
-    def _instantiate_series(self, x_values, y_values):
-        for x, y in zip(x_values, y_values):
-            self.pacer_circumference_coord.append(x, y)
-            self.breath_circumference_coord.append(x, y)
-
-    def update_pacer_series(self, x_values, y_values):
-        for i, (x, y) in enumerate(zip(x_values, y_values)):
-            self.pacer_circumference_coord.replace(i, x, y)
-
-    def update_breath_series(self, x_values, y_values):
-        for i, (x, y) in enumerate(zip(x_values, y_values)):
-            self.breath_circumference_coord.replace(i, x, y)
-
-    def apply_background_image_to_chart(self):
-        """Apply the background image directly to the chart background"""
+            self.breath_disk_brush = QBrush(QColor(180, 180, 240, 120))
+
+        # Each disk's gradient is baked into a pixmap at the full disk size on screen, once per
+        # widget size; painting then only blits it scaled down to the current radius
+        self.disk_pixmap = None
+        self.breath_disk_pixmap = None
+        self.disk_side = None
+
+    def _render_disk(self, brush, side, dpr):
+        """Renders a disk filled with the given brush into a transparent pixmap, in device pixels."""
+        pixmap = QPixmap(side, side)
+        pixmap.fill(Qt.transparent)
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(brush)
+        painter.drawEllipse(pixmap.rect())
+        painter.end()
+        pixmap.setDevicePixelRatio(dpr)
+        return pixmap
+
+    def update_pacer_series(self, radius):
+        # Skip the repaint if the disk has not changed, e.g. while the breathing signal is static
+        if radius == self.pacer_radius:
+            return
+        self.pacer_radius = radius
+        self._schedule_render()
+
+    def update_breath_series(self, radius):
+        if radius == self.breath_radius:
+            return
+        self.breath_radius = radius
+        self._schedule_render()
+
+    def _schedule_render(self):
+        """Schedules a single repaint for the next frame, unless one is already pending."""
+        if not self.render_timer.isActive():
+            self.render_timer.start()
+
+    def apply_background_image(self):
+        """Compose the background image with its gradient overlay into the background brush"""
         if self.background_image.isNull():
-            print("Error: Background image is null")
+            self.logger.error("Background image is null")
             return
             
         # Create a pixmap to draw on
-        chart_size = self.plot.size()
-        if chart_size.isEmpty():
-            chart_size = QSize(400, 400)  # Default size if chart size not available
+        if self.size().isEmpty():
+            size = QSize(400, 400)  # Default size if widget size not available
         else:
-            # Convert QSizeF to QSize
-            chart_size = QSize(int(chart_size.width()), int(chart_size.height()))
-            
-        background = QPixmap(chart_size)
+            size = self._background_size()
+
+        # Reuse the background composed for this image and size, if any
+        key = (self.background_image.cacheKey(), size.width(), size.height())
+        if key in self.bg_cache:
+            self.bg_cache.move_to_end(key)
+            self.background_brush = QBrush(self.bg_cache[key])
+            self.update()
+            return
+
+        background = QPixmap(size)
         background.fill(QColor(30, 30, 40))  # Fill with dark background
         
         # Draw the lungs image onto the background
         painter = QPainter(background)
         painter.setRenderHint(QPainter.Antialiasing)
         
-        # Scale the image to fit the chart
+        # Scale the image to fit the widget
         img_rect = self.background_image.rect()
         target_rect = background.rect()
         
@@ -179,9 +183,16 @@ class CirclesWidget(QChartView):
         x = (target_rect.width() - new_width) // 2
         y = (target_rect.height() - new_height) // 2
         
+        # Scale the image once per size, so drawing it is a plain blit
+        if self.scaled_bg_size != (new_width, new_height):
+            self.scaled_bg = self.background_image.scaled(
+                new_width, new_height, Qt.KeepAspectRatio, Qt.SmoothTransformation
+            )
+            self.scaled_bg_size = (new_width, new_height)
+
         # Draw the image
         painter.setOpacity(0.6)  # Higher opacity of 60%
-        painter.drawPixmap(x, y, new_width, new_height, self.background_image)
+        painter.drawPixmap(x, y, self.scaled_bg)
         
         # Apply a subtle dark gradient overlay
         gradient = QRadialGradient(target_rect.width() / 2, target_rect.height() / 2, 
@@ -193,30 +204,102 @@ class CirclesWidget(QChartView):
         
         painter.end()
         
-        # Apply the combined background to the chart
-        self.plot.setBackgroundBrush(QBrush(background))
-        print(f"Applied background image at {x},{y} with size {new_width}x{new_height}")
+        # Use the combined background from the next paint
+        self.background_brush = QBrush(background)
+        self.bg_cache[key] = background
+        if len(self.bg_cache) > self.BG_CACHE_SIZE:
+            self.bg_cache.popitem(last=False)
+        self.update()
+        self.logger.debug(f"Applied background image at {x},{y} with size {new_width}x{new_height}")
 
     def set_background_image(self, image_path):
         """Set a new background image for the widget"""
         self.background_image = QPixmap(image_path)
+        self.scaled_bg_size = None
         if not self.background_image.isNull():
-            self.apply_background_image_to_chart()
+            self.apply_background_image()
         self.update()
 
+    def _render_shadow(self, size):
+        """Renders a soft shadow of the rounded background, offset down and right."""
+        pixmap = QPixmap(size)
+        pixmap.fill(Qt.transparent)
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(Qt.NoPen)
+
+        # Stack translucent rounded rects, growing out from the shadow's core, to fake a blur
+        shadow = QRectF(0, 0, size.width() - self.SHADOW_MARGIN, size.height() - self.SHADOW_MARGIN)
+        shadow.translate(self.SHADOW_OFFSET, self.SHADOW_OFFSET)
+        steps = self.SHADOW_MARGIN - self.SHADOW_OFFSET
+        painter.setBrush(QColor(0, 0, 0, 60 // (steps + 1)))
+        for k in range(steps + 1):
+            painter.drawRoundedRect(shadow.adjusted(-k, -k, k, k), 10 + k, 10 + k)
+
+        painter.end()
+        return pixmap
+
     def paintEvent(self, event):
-        # We're using the chart's background brush for the lungs image
-        # Call the parent's paintEvent directly
-        super().paintEvent(event)
+        painter = QPainter(self)
+        rect = QRectF(self.rect())
+
+        # Rounded background with a subtle border, over the window colour and the shadow
+        painter.fillRect(rect, DARK_BG)
+        if self.shadow:
+            if self.shadow_pixmap is None or self.shadow_pixmap.size() != self.size():
+                self.shadow_pixmap = self._render_shadow(self.size())
+            painter.drawPixmap(0, 0, self.shadow_pixmap)
+            rect.adjust(0, 0, -self.SHADOW_MARGIN, -self.SHADOW_MARGIN)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(self.border_pen)
+        if self.background_brush.style() == Qt.TexturePattern:
+            # The composed background is snapped up to the grid, so centre it on the rect
+            texture = self.background_brush.texture().size()
+            painter.setBrushOrigin(QPointF(rect.x() - (texture.width() - rect.width()) / 2,
+                                           rect.y() - (texture.height() - rect.height()) / 2))
+        painter.setBrush(self.background_brush)
+        painter.drawRoundedRect(rect.adjusted(0.5, 0.5, -0.5, -0.5), 10, 10)
+
+        # Disks centred in the widget, a radius of 1 spanning half its side
+        unit = min(rect.width(), rect.height()) / 2
+        dpr = self.devicePixelRatioF()
+        side = max(1, round(2 * unit * dpr))
+        if self.disk_side != (side, dpr):
+            self.disk_pixmap = self._render_disk(self.disk_brush, side, dpr)
+            self.breath_disk_pixmap = self._render_disk(self.breath_disk_brush, side, dpr)
+            self.disk_side = (side, dpr)
+        painter.setRenderHint(QPainter.SmoothPixmapTransform)
+        center = rect.center()
+        for radius, pixmap in ((self.pacer_radius, self.disk_pixmap),
+                               (self.breath_radius, self.breath_disk_pixmap)):
+            if radius > 0:
+                r = radius * unit
+                painter.drawPixmap(QRectF(center.x() - r, center.y() - r, 2 * r, 2 * r), pixmap, QRectF(pixmap.rect()))
+
+        painter.end()
 
     def sizeHint(self):
         side = self.size().height()
         return QSize(side, side)
 
+    @staticmethod
+    def _snap(length):
+        """Rounds a length up to a multiple of 8 pixels."""
+        return (int(length) + 7) & ~7
+
+    def _background_size(self):
+        """Size of the rounded background, inside the shadow margin, rounded up to the grid."""
+        # Rounding up lets small size changes reuse a background
+        margin = self.SHADOW_MARGIN if self.shadow else 0
+        return QSize(self._snap(self.width() - margin), self._snap(self.height() - margin))
+
     def resizeEvent(self, event):
-        # Update the background image when the widget is resized
+        # Update the background image when the widget is resized past the 8 pixel grid
         if hasattr(self, 'background_image') and self.background_image and not self.background_image.isNull():
-            self.apply_background_image_to_chart()
+            snapped_size = self._background_size()
+            if snapped_size != self.bg_snapped_size:
+                self.bg_snapped_size = snapped_size
+                self.bg_timer.start(50)
             
         if self.size().width() != self.size().height():
             self.updateGeometry()
@@ -226,14 +309,17 @@ class CirclesWidget(QChartView):
 class SquareWidget(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+        # Let the layout keep the widget square, instead of constraining it on every resize
+        policy = QSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+        policy.setHeightForWidth(True)
+        self.setSizePolicy(policy)
         self.setStyleSheet(f"background-color: {DARK_BG.name()};")
 
     def sizeHint(self):
         return QSize(100, 100)
 
-    def resizeEvent(self, event):
-        side = min(self.width(), self.height())
-        self.setMaximumWidth(side)
-        self.setMaximumHeight(side)
-        return super().resizeEvent(event)
+    def hasHeightForWidth(self):
+        return True
+
+    def heightForWidth(self, width):
+        return width